@@ -14,16 +14,21 @@ class YouTubeDownloader:
     or video.
     """
 
-    def __init__(self, music_folder, convert_to_mp3=True):
+    def __init__(self, music_folder, convert_to_mp3=True, transcode_mode=None):
         """
         Initialize the downloader with a target folder and audio conversion setting.
 
         :param music_folder: Path where downloaded files will be saved.
         :param convert_to_mp3: If True, audio downloads are converted to MP3.
+        :param transcode_mode: Optional MP3 conversion policy
+                               ('always' / 'if_needed' / 'never'); see
+                               :class:`MusicDownloader`.
         """
         self.music_folder = music_folder
         self.convert_to_mp3 = convert_to_mp3
-        self._music_downloader = MusicDownloader(music_folder, convert_to_mp3)
+        self._music_downloader = MusicDownloader(
+            music_folder, convert_to_mp3, transcode_mode=transcode_mode
+        )
         self._video_downloader = VideoDownloader(music_folder)
 
     def download_music(self, url):
@@ -35,6 +40,18 @@ class YouTubeDownloader:
         """
         return self._music_downloader.download(url)
 
+    def download_music_batch(self, urls):
+        """
+        Download several tracks, overlapping downloads with MP3 conversion.
+
+        :param urls: Iterable of YouTube URLs, or a single playlist URL
+                     (which is expanded into its entries).
+        :return: List of result dictionaries, one per track, in order.
+        """
+        if isinstance(urls, str):
+            urls = self._music_downloader.playlist_entries(urls)
+        return self._music_downloader.download_batch(urls)
+
     def download_video(self, url):
         """
         Download video from a YouTube URL.
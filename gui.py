@@ -3,9 +3,11 @@
 Graphical user interface for YouTube Downloader using CustomTkinter.
 """
 
-import threading
+import multiprocessing
+import signal
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from tkinter import filedialog, messagebox
+from tkinter import TclError, filedialog, messagebox
 
 import customtkinter as ctk
 from downloader import YouTubeDownloader
@@ -15,6 +17,30 @@ ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
 
+def _worker_sigterm(signum, frame):
+    """Turn SIGTERM into a normal exception inside a worker."""
+    raise SystemExit(1)
+
+
+def _worker_init():
+    """
+    Worker-process startup: make SIGTERM raise instead of killing outright,
+    so an in-flight subprocess.run kills its ffmpeg child and the PyAV
+    finally-close blocks run when the pool is terminated on window close.
+    """
+    signal.signal(signal.SIGTERM, _worker_sigterm)
+
+
+def _music_task(folder, url):
+    """Run one music download in a worker process."""
+    return YouTubeDownloader(folder, convert_to_mp3=True).download_music(url)
+
+
+def _video_task(folder, url):
+    """Run one video download in a worker process."""
+    return YouTubeDownloader(folder).download_video(url)
+
+
 class App(ctk.CTk):
     """Main application window."""
 
@@ -33,10 +59,61 @@ class App(ctk.CTk):
 
         # Default download folder is the user's Downloads directory
         self.folder_path = str(Path.home() / "Downloads")
-        self.downloader = None
+
+        # Downloads run in worker processes so the per-packet encode work
+        # never contends with the Tk main loop for the GIL.
+        self._pool = None
+        self._futures = set()
 
         self.create_widgets()
 
+        # Shut the worker pool down cleanly instead of abandoning it
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _get_pool(self):
+        """Return the worker pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=2, initializer=_worker_init)
+        return self._pool
+
+    def _submit(self, task, on_done, *args):
+        """
+        Submit a task to the worker pool and bridge its future back to the
+        GUI thread once it finishes.
+        """
+        future = self._get_pool().submit(task, *args)
+        self._futures.add(future)
+        future.add_done_callback(lambda f: self._schedule(on_done, f))
+        return future
+
+    def _schedule(self, callback, future):
+        """Hop to the Tk thread, ignoring callbacks that land after close."""
+        self._futures.discard(future)
+        if future.cancelled():
+            return
+        try:
+            self.after(0, callback, future)
+        except (RuntimeError, TclError):
+            # Window already destroyed
+            pass
+
+    def _on_close(self):
+        """Cancel queued downloads, stop the workers, and close the window."""
+        for future in list(self._futures):
+            future.cancel()
+        if self._pool is not None:
+            # Snapshot the workers first: shutdown() clears the pool's
+            # process table.
+            workers = list((self._pool._processes or {}).values())
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            # shutdown() only drops queued futures; an in-flight download
+            # would keep the process alive headless after the window is
+            # gone, so terminate the workers outright. Partial downloads
+            # are resumed on the next run (continuedl).
+            for proc in workers:
+                proc.terminate()
+        self.destroy()
+
     def create_widgets(self):
         """Build all UI components."""
         self.title_label = ctk.CTkLabel(
@@ -154,18 +231,16 @@ class App(ctk.CTk):
         self.progressbar.pack(pady=5)
         self.progressbar.start()
 
-        self.downloader = YouTubeDownloader(self.folder_path, convert_to_mp3=True)
-        thread = threading.Thread(target=self.music_download_thread, args=(url,))
-        thread.daemon = True
-        thread.start()
+        self._submit(_music_task, self._music_future_done, self.folder_path, url)
 
-    def music_download_thread(self, url):
-        """Background task for music download."""
+    def _music_future_done(self, future):
+        """Bridge a finished music-download future back to the GUI thread."""
         try:
-            result = self.downloader.download_music(url)
-            self.after(0, self.music_download_finished, result)
+            result = future.result()
         except Exception as e:
-            self.after(0, self.music_download_error, str(e))
+            self.music_download_error(str(e))
+        else:
+            self.music_download_finished(result)
 
     def music_download_finished(self, result):
         """Handle successful or failed music download (GUI thread)."""
@@ -201,18 +276,16 @@ class App(ctk.CTk):
         self.progressbar.pack(pady=5)
         self.progressbar.start()
 
-        self.downloader = YouTubeDownloader(self.folder_path)
-        thread = threading.Thread(target=self.video_download_thread, args=(url,))
-        thread.daemon = True
-        thread.start()
+        self._submit(_video_task, self._video_future_done, self.folder_path, url)
 
-    def video_download_thread(self, url):
-        """Background task for video download."""
+    def _video_future_done(self, future):
+        """Bridge a finished video-download future back to the GUI thread."""
         try:
-            result = self.downloader.download_video(url)
-            self.after(0, self.video_download_finished, result)
+            result = future.result()
         except Exception as e:
-            self.after(0, self.video_download_error, str(e))
+            self.video_download_error(str(e))
+        else:
+            self.video_download_finished(result)
 
     def video_download_finished(self, result):
         """Handle successful or failed video download (GUI thread)."""
@@ -237,5 +310,8 @@ class App(ctk.CTk):
 
 
 if __name__ == "__main__":
+    # Required for frozen (EXE) builds: worker processes re-import this
+    # module, and without this the spawned child re-launches the app.
+    multiprocessing.freeze_support()
     app = App()
     app.mainloop()
\ No newline at end of file
@@ -4,8 +4,16 @@ Music (audio) downloader module. Handles downloading, metadata embedding,
 optional conversion to MP3, and lyrics extraction from subtitles.
 """
 
+import functools
 import io
 import os
+import queue
+import re
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
 import requests
@@ -16,6 +24,100 @@ from mutagen.mp4 import MP4, MP4Cover
 from mutagen.mp3 import MP3
 from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, USLT, APIC
 
+# Path to the ffmpeg binary, if one is installed. Transcoding runs through an
+# ffmpeg subprocess when available and falls back to PyAV otherwise.
+_FFMPEG = shutil.which('ffmpeg')
+
+# Maximum number of files kept in the on-disk thumbnail/subtitle cache;
+# least-recently-used entries (by mtime) are evicted beyond this.
+_CACHE_MAX_FILES = 256
+
+# Matches VTT cue-text lines: skips header lines, timestamp lines and blanks
+# in a single compiled pass instead of several string checks per line.
+_VTT_TEXT_LINE = re.compile(
+    r'^(?!WEBVTT|Kind:|Language:|NOTE)(?!.*-->).*\S.*$', re.MULTILINE
+)
+
+
+# Probe once at import whether Pillow can decode WebP; the cover handler for
+# WebP thumbnails is bound from this instead of being re-decided per track.
+try:
+    from PIL import features as _pil_features
+    _HAS_WEBP = _pil_features.check('webp')
+except Exception:
+    _HAS_WEBP = False
+
+
+def _cover_webp(data):
+    """Decode a WebP thumbnail and re-encode it as JPEG for MP4 embedding."""
+    img = Image.open(io.BytesIO(data))
+    jpg_io = io.BytesIO()
+    img.convert('RGB').save(jpg_io, format='JPEG', quality=85)
+    return jpg_io.getvalue(), MP4Cover.FORMAT_JPEG
+
+
+def _cover_png(data):
+    """Embed PNG bytes unchanged."""
+    return data, MP4Cover.FORMAT_PNG
+
+
+def _cover_jpeg(data):
+    """Embed JPEG bytes unchanged."""
+    return data, MP4Cover.FORMAT_JPEG
+
+
+def _cover_skip(data):
+    """Drop the cover (no decoder available for its format)."""
+    return None, None
+
+
+# Header sniff -> handler, resolved once at import time.
+_COVER_HANDLERS = {
+    'webp': _cover_webp if _HAS_WEBP else _cover_skip,
+    'png': _cover_png,
+    'jpeg': _cover_jpeg,
+}
+
+
+def _sniff_cover(data):
+    """Classify image bytes by signature; unknown formats are treated as JPEG."""
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return 'png'
+    return 'jpeg'
+
+
+@dataclass(slots=True)
+class _TrackMeta:
+    """
+    Tag values for one track, computed once from the yt-dlp info dictionary
+    and shared by the M4A and MP3 embedding steps, so neither has to re-walk
+    the info dict or re-read tags from disk.
+    """
+    title: str
+    artist: str
+    album: str
+    year: str
+    lyrics: str = None
+    cover_data: bytes = None
+    cover_fmt: int = None
+
+    @classmethod
+    def from_info(cls, info):
+        """
+        Build track metadata from a yt-dlp info dictionary.
+
+        :param info: info dictionary from yt-dlp.
+        :return: _TrackMeta with the basic text tags populated.
+        """
+        return cls(
+            title=info.get('title', 'Unknown'),
+            artist=info.get('artist') or info.get('uploader', 'Unknown Artist'),
+            album=info.get('album', 'Unknown Album'),
+            year=(info.get('upload_date') or '')[:4],
+        )
+
 
 class MusicDownloader:
     """
@@ -23,14 +125,29 @@ class MusicDownloader:
     and optionally converts to MP3.
     """
 
-    def __init__(self, music_folder, convert_to_mp3=True):
+    #: Valid values for ``transcode_mode``.
+    TRANSCODE_MODES = ('always', 'if_needed', 'never')
+
+    def __init__(self, music_folder, convert_to_mp3=True, transcode_mode=None):
         """
         :param music_folder: Directory where audio files will be saved.
         :param convert_to_mp3: If True, convert downloaded M4A to MP3 and delete the original.
+        :param transcode_mode: Optional override for the MP3 conversion policy:
+                               'always' re-encodes every download, 'if_needed'
+                               only re-encodes sources that are not already
+                               AAC-in-M4A (avoiding a pointless quality loss),
+                               'never' keeps the downloaded file as-is.
+                               Defaults to 'always'/'never' based on
+                               ``convert_to_mp3``.
         """
         self.music_folder = Path(music_folder)
         self.music_folder.mkdir(exist_ok=True)
-        self.convert_to_mp3 = convert_to_mp3
+        if transcode_mode is None:
+            transcode_mode = 'always' if convert_to_mp3 else 'never'
+        if transcode_mode not in self.TRANSCODE_MODES:
+            raise ValueError(f"transcode_mode must be one of {self.TRANSCODE_MODES}")
+        self.transcode_mode = transcode_mode
+        self.convert_to_mp3 = transcode_mode != 'never'
 
         # yt-dlp options for audio download
         self.ydl_opts = {
@@ -41,8 +158,42 @@ class MusicDownloader:
             'writesubtitles': False,
             'outtmpl': str(self.music_folder / '%(title)s.%(ext)s'),
             'quiet': True,
+            # Resume .part files from interrupted runs instead of restarting
+            'continuedl': True,
         }
 
+        # When every download is converted anyway and ffmpeg is available,
+        # let yt-dlp's own postprocessor do the transcode as part of the
+        # download pipeline — one FFmpeg pass, no second conversion step.
+        self._pp_transcode = self.transcode_mode == 'always' and _FFMPEG is not None
+        if self._pp_transcode:
+            self.ydl_opts['postprocessors'] = [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'mp3',
+                'preferredquality': '192',
+            }]
+
+        # Reused for filename templating; constructing a YoutubeDL per call
+        # is surprisingly expensive.
+        self._ydl_filename = yt_dlp.YoutubeDL(
+            {'outtmpl': self.ydl_opts['outtmpl'], 'quiet': True}
+        )
+
+        # Shared HTTP session so thumbnail and subtitle fetches reuse pooled
+        # keep-alive connections instead of a fresh TCP+TLS handshake each.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers['Accept-Encoding'] = 'gzip'
+
+        # Per-video cache of thumbnail/subtitle bytes so re-downloads (retries,
+        # playlist re-grabs) skip the network round-trips entirely. Backed by
+        # a small in-memory LRU for repeat fetches within one session.
+        self._cache_dir = self.music_folder / '.cache'
+        self._cache_dir.mkdir(exist_ok=True)
+        self._fetch_url = functools.lru_cache(maxsize=64)(self._fetch_url_uncached)
+
     def _get_final_path(self, info):
         """
         Generate the final file path using yt-dlp's filename template.
@@ -50,17 +201,15 @@ class MusicDownloader:
         :param info: info dictionary from yt-dlp.
         :return: Path object pointing to the downloaded file.
         """
-        return self.music_folder / Path(
-            yt_dlp.YoutubeDL({'outtmpl': self.ydl_opts['outtmpl']}).prepare_filename(info)
-        ).name
+        return self.music_folder / Path(self._ydl_filename.prepare_filename(info)).name
 
     @staticmethod
-    def _get_lyrics_text(info):
+    def _get_lyrics_url(info):
         """
-        Extract lyrics from automatic captions or subtitles if available.
+        Pick the subtitle URL to use for lyrics, if any.
 
         :param info: info dictionary from yt-dlp.
-        :return: Lyrics as a string, or None if not found.
+        :return: Subtitle URL string, or None if no captions exist.
         """
         lyrics_url = None
         # Try automatic captions first
@@ -80,27 +229,92 @@ class MusicDownloader:
             if not lyrics_url and info['subtitles']['en']:
                 lyrics_url = info['subtitles']['en'][0]['url']
 
-        if lyrics_url:
-            try:
-                resp = requests.get(lyrics_url, timeout=10)
-                if resp.status_code == 200:
-                    lines = []
-                    for line in resp.text.splitlines():
-                        # Skip timestamps and header lines
-                        if '-->' not in line and line.strip() and not line.startswith(
-                                ('WEBVTT', 'Kind:', 'Language:', 'NOTE')):
-                            lines.append(line.strip())
-                    return '\n'.join(lines)
-            except Exception:
-                pass
-        return None
+        return lyrics_url
+
+    @staticmethod
+    def _parse_lyrics(data):
+        """
+        Extract lyric lines from a VTT subtitle body.
+
+        :param data: Raw VTT bytes.
+        :return: Lyrics as a string.
+        """
+        text = data.decode('utf-8', 'replace')
+        return '\n'.join(line.strip() for line in _VTT_TEXT_LINE.findall(text))
+
+    @staticmethod
+    def _pick_thumbnail_url(info):
+        """
+        Choose the best thumbnail URL, preferring JPEG variants.
+
+        yt-dlp lists thumbnails in ascending quality; picking the best JPEG
+        avoids the WebP decode/re-encode round-trip entirely.
+
+        :param info: info dictionary from yt-dlp.
+        :return: Thumbnail URL string, or None if no thumbnails exist.
+        """
+        thumbnails = info.get('thumbnails')
+        if not thumbnails:
+            return None
+        for thumb in reversed(thumbnails):
+            url = thumb.get('url', '')
+            if url.split('?', 1)[0].lower().endswith(('.jpg', '.jpeg')):
+                return url
+        return thumbnails[-1]['url']
 
-    def _embed_all(self, m4a_path, info):
+    def _fetch_extras(self, info, meta):
+        """
+        Fetch cover art and lyrics and store them on ``meta``.
+
+        The two fetches hit independent URLs, so they run concurrently on a
+        small thread pool over the shared keep-alive session; the metadata
+        phase takes max(thumbnail, subtitles) instead of their sum.
+
+        :param info: info dictionary from yt-dlp.
+        :param meta: _TrackMeta to populate.
+        """
+        try:
+            video_id = info.get('id')
+            thumb_url = self._pick_thumbnail_url(info)
+            lyrics_url = self._get_lyrics_url(info)
+
+            thumb_future = lyrics_future = None
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                if thumb_url:
+                    thumb_future = pool.submit(
+                        self._fetch_cached, thumb_url,
+                        f"{video_id}.thumb" if video_id else None
+                    )
+                if lyrics_url:
+                    lyrics_future = pool.submit(
+                        self._fetch_cached, lyrics_url,
+                        f"{video_id}.vtt" if video_id else None
+                    )
+
+            # Cover art
+            if thumb_future is not None:
+                data = thumb_future.result()
+                if data:
+                    cover_data, cover_fmt = _COVER_HANDLERS[_sniff_cover(data)](data)
+                    if cover_data:
+                        meta.cover_data = cover_data
+                        meta.cover_fmt = cover_fmt
+
+            # Lyrics
+            if lyrics_future is not None:
+                data = lyrics_future.result()
+                if data:
+                    meta.lyrics = self._parse_lyrics(data)
+        except Exception:
+            # Silently fail on metadata errors; download still succeeded.
+            pass
+
+    def _embed_all(self, m4a_path, meta):
         """
         Embed metadata (title, artist, album, year, cover, lyrics) into an M4A file.
 
         :param m4a_path: Path to the downloaded M4A file.
-        :param info: info dictionary from yt-dlp.
+        :param meta: _TrackMeta (as filled in by :meth:`_fetch_extras`).
         """
         try:
             audio = MP4(str(m4a_path))
@@ -109,38 +323,17 @@ class MusicDownloader:
             tags = audio.tags
 
             # Basic tags
-            tags["\xa9nam"] = [info.get('title', 'Unknown')]
-            tags["\xa9ART"] = [info.get('artist') or info.get('uploader', 'Unknown Artist')]
-            tags["\xa9alb"] = [info.get('album', 'Unknown Album')]
-            if 'upload_date' in info:
-                tags["\xa9day"] = [info['upload_date'][:4]]
+            tags["\xa9nam"] = [meta.title]
+            tags["\xa9ART"] = [meta.artist]
+            tags["\xa9alb"] = [meta.album]
+            if meta.year:
+                tags["\xa9day"] = [meta.year]
 
-            # Cover art
-            cover_data = None
-            cover_fmt = None
-            if info.get('thumbnails'):
-                thumb_url = info['thumbnails'][-1]['url']
-                resp = requests.get(thumb_url, timeout=10)
-                if resp.status_code == 200:
-                    data = resp.content
-                    # Check if thumbnail is WebP, convert to JPEG
-                    if thumb_url.lower().endswith('.webp') or (data[:4] == b'RIFF' and b'WEBP' in data[:12]):
-                        img = Image.open(io.BytesIO(data))
-                        jpg_io = io.BytesIO()
-                        img.convert('RGB').save(jpg_io, format='JPEG')
-                        cover_data = jpg_io.getvalue()
-                        cover_fmt = MP4Cover.FORMAT_JPEG
-                    else:
-                        cover_data = data
-                        cover_fmt = MP4Cover.FORMAT_JPEG
+            if meta.cover_data:
+                tags["covr"] = [MP4Cover(meta.cover_data, imageformat=meta.cover_fmt)]
 
-            if cover_data:
-                tags["covr"] = [MP4Cover(cover_data, imageformat=cover_fmt)]
-
-            # Lyrics
-            lyrics = self._get_lyrics_text(info)
-            if lyrics:
-                tags["\xa9lyr"] = [lyrics]
+            if meta.lyrics:
+                tags["\xa9lyr"] = [meta.lyrics]
 
             audio.save()
         except Exception:
@@ -148,25 +341,14 @@ class MusicDownloader:
             pass
 
     @staticmethod
-    def _copy_tags(m4a_path, mp3_path):
+    def _copy_tags(mp3_path, meta):
         """
-        Copy metadata from an M4A file to an MP3 file.
+        Write track metadata into an MP3 file's ID3 tags.
 
-        :param m4a_path: Path to source M4A file (with embedded tags).
         :param mp3_path: Path to target MP3 file.
+        :param meta: _TrackMeta (as filled in by :meth:`_fetch_extras`).
         """
         try:
-            m4a = MP4(m4a_path)
-            if not m4a.tags:
-                return
-
-            title = m4a.get('\xa9nam', ['Unknown'])[0]
-            artist = m4a.get('\xa9ART', ['Unknown Artist'])[0]
-            album = m4a.get('\xa9alb', ['Unknown Album'])[0]
-            date = m4a.get('\xa9day', [''])[0]
-            lyrics = m4a.get('\xa9lyr', [None])[0]
-            cover_list = m4a.get('covr', [])
-
             # Ensure MP3 has ID3 tags
             try:
                 mp3 = MP3(mp3_path, ID3=ID3)
@@ -174,19 +356,23 @@ class MusicDownloader:
                 mp3 = MP3(mp3_path)
                 mp3.add_tags()
 
-            tags = mp3.tags
+            # Local bindings avoid a global lookup per frame construction
+            _TIT2, _TPE1, _TALB = TIT2, TPE1, TALB
+            _TDRC, _USLT, _APIC = TDRC, USLT, APIC
 
-            tags.add(TIT2(encoding=3, text=title))
-            tags.add(TPE1(encoding=3, text=artist))
-            tags.add(TALB(encoding=3, text=album))
-            if date:
-                tags.add(TDRC(encoding=3, text=date))
+            frames = [
+                _TIT2(encoding=3, text=meta.title),
+                _TPE1(encoding=3, text=meta.artist),
+                _TALB(encoding=3, text=meta.album),
+            ]
+            if meta.year:
+                frames.append(_TDRC(encoding=3, text=meta.year))
 
-            if lyrics:
-                tags.add(USLT(encoding=3, lang='eng', desc='', text=lyrics))
+            if meta.lyrics:
+                frames.append(_USLT(encoding=3, lang='eng', desc='', text=meta.lyrics))
 
-            if cover_list:
-                cover_data = cover_list[0]
+            if meta.cover_data:
+                cover_data = meta.cover_data
                 # Detect image type
                 if cover_data.startswith(b'\xff\xd8'):
                     mime = 'image/jpeg'
@@ -195,7 +381,7 @@ class MusicDownloader:
                 else:
                     mime = 'image/jpeg'
 
-                tags.add(APIC(
+                frames.append(_APIC(
                     encoding=3,
                     mime=mime,
                     type=3,          # front cover
@@ -203,22 +389,63 @@ class MusicDownloader:
                     data=cover_data
                 ))
 
+            add = mp3.tags.add
+            for frame in frames:
+                add(frame)
+
             mp3.save(v2_version=3)
         except Exception:
             pass
 
-    def _convert_to_mp3(self, m4a_path):
+    def _convert_to_mp3(self, m4a_path, meta):
         """
-        Convert an M4A file to MP3 using PyAV.
+        Convert an M4A file to MP3.
+
+        Uses a single ffmpeg subprocess when the binary is available: the whole
+        decode/encode loop then runs in native code with large buffers instead
+        of per-frame Python round-trips, and the GIL stays free for concurrent
+        downloads. Falls back to PyAV when ffmpeg is not installed.
 
         :param m4a_path: Path to the M4A file.
+        :param meta: _TrackMeta used to tag the resulting MP3.
         :return: Path to the converted MP3 file, or None on failure.
         """
         mp3_path = m4a_path.with_suffix('.mp3')
         try:
-            input_container = av.open(str(m4a_path))
-            output_container = av.open(str(mp3_path), 'w', format='mp3')
+            if _FFMPEG:
+                subprocess.run(
+                    [_FFMPEG, '-y', '-i', str(m4a_path),
+                     '-c:a', 'libmp3lame', '-b:a', '192k',
+                     '-map_metadata', '0', str(mp3_path)],
+                    check=True,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            else:
+                self._convert_to_mp3_pyav(m4a_path, mp3_path)
 
+            if not mp3_path.exists():
+                raise Exception("MP3 file not created")
+
+            # Tag the new MP3 from the precomputed metadata
+            # (cover art and lyrics do not survive ffmpeg's -map_metadata).
+            self._copy_tags(mp3_path, meta)
+            return mp3_path
+        except Exception:
+            return None
+
+    @staticmethod
+    def _convert_to_mp3_pyav(m4a_path, mp3_path):
+        """
+        Convert an M4A file to MP3 using PyAV (fallback when ffmpeg is absent).
+
+        :param m4a_path: Path to the M4A file.
+        :param mp3_path: Path for the output MP3 file.
+        """
+        input_container = av.open(str(m4a_path))
+        output_container = av.open(str(mp3_path), 'w', format='mp3')
+        try:
             out_stream = output_container.add_stream('mp3', rate=44100)
             out_stream.options = {'b': '192k'}
 
@@ -229,18 +456,144 @@ class MusicDownloader:
             # Flush encoder
             for packet in out_stream.encode():
                 output_container.mux(packet)
-
+        finally:
+            # Always close, so an interrupted run doesn't leave an unflushed
+            # (corrupt) output container behind
             output_container.close()
             input_container.close()
 
-            if not mp3_path.exists():
-                raise Exception("MP3 file not created")
+    def _fetch_url_uncached(self, url):
+        """
+        Fetch a URL over the shared session.
 
-            # Copy metadata from the original M4A to the new MP3
-            self._copy_tags(m4a_path, mp3_path)
-            return mp3_path
+        Streams the body into a buffer preallocated from Content-Length, so
+        large covers (100-300 KB JPEGs) land in one allocation instead of
+        repeated growth-and-copy of requests' internal accumulator.
+
+        :param url: URL to fetch.
+        :return: Response body as bytes, or None on failure.
+        """
+        try:
+            with self._session.get(url, stream=True, timeout=10) as resp:
+                if resp.status_code != 200:
+                    return None
+                buf = bytearray(int(resp.headers.get('Content-Length') or 0))
+                offset = 0
+                for chunk in resp.iter_content(chunk_size=1 << 16):
+                    buf[offset:offset + len(chunk)] = chunk
+                    offset += len(chunk)
+                # Decompression or a short read can leave the actual size
+                # differing from the advertised one; the splice above grows
+                # the buffer as needed, this trims any shortfall.
+                del buf[offset:]
+                return bytes(buf)
         except Exception:
-            return None
+            pass
+        return None
+
+    def _fetch_cached(self, url, cache_name):
+        """
+        Fetch a URL, consulting the on-disk cache first.
+
+        :param url: URL to fetch.
+        :param cache_name: File name for the cache entry (typically video id
+                           plus a suffix), or None to bypass the disk cache.
+        :return: Bytes, or None on failure.
+        """
+        cache_file = self._cache_dir / cache_name if cache_name else None
+        if cache_file is not None and cache_file.exists():
+            try:
+                data = cache_file.read_bytes()
+                os.utime(cache_file)  # refresh mtime so LRU eviction spares it
+                return data
+            except OSError:
+                pass
+
+        data = self._fetch_url(url)
+        if data and cache_file is not None:
+            try:
+                cache_file.write_bytes(data)
+                self._evict_cache()
+            except OSError:
+                pass
+        return data
+
+    def _evict_cache(self):
+        """Drop the least-recently-used disk cache entries beyond the cap."""
+        try:
+            entries = [p for p in self._cache_dir.iterdir() if p.is_file()]
+            if len(entries) <= _CACHE_MAX_FILES:
+                return
+            entries.sort(key=lambda p: p.stat().st_mtime)
+            for stale in entries[:len(entries) - _CACHE_MAX_FILES]:
+                stale.unlink()
+        except OSError:
+            pass
+
+    def _should_transcode(self, info):
+        """
+        Decide whether the downloaded file should be re-encoded to MP3.
+
+        Re-encoding AAC to MP3 is the most expensive step in the pipeline and
+        a strict quality loss, so 'if_needed' skips it whenever the source is
+        already AAC-in-M4A — a perfectly portable, taggable file.
+
+        :param info: info dictionary from yt-dlp.
+        :return: True if _convert_to_mp3 should run.
+        """
+        if self.transcode_mode == 'never':
+            return False
+        if self.transcode_mode == 'always':
+            return True
+        acodec = (info.get('acodec') or '').lower()
+        return not acodec.startswith(('mp4a', 'aac'))
+
+    def _download_one(self, url):
+        """
+        Run the network-bound part of a download: fetch the audio stream via yt-dlp.
+
+        :param url: YouTube URL.
+        :return: Tuple of (Path to the downloaded M4A file, info dictionary).
+        """
+        with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+        return self._get_final_path(info), info
+
+    def _finalize(self, m4a_path, info):
+        """
+        Run the CPU-bound part of a download: embed metadata and optionally
+        convert to MP3.
+
+        :param m4a_path: Path to the downloaded M4A file.
+        :param info: info dictionary from yt-dlp.
+        :return: Result dictionary (same shape as :meth:`download`).
+        """
+        meta = _TrackMeta.from_info(info)
+        self._fetch_extras(info, meta)
+
+        mp3_path = m4a_path.with_suffix('.mp3')
+        if self._pp_transcode and mp3_path.exists():
+            # yt-dlp's FFmpegExtractAudio already produced the MP3 during
+            # the download; only the tags remain to be written.
+            self._copy_tags(mp3_path, meta)
+            final_path = mp3_path
+        else:
+            self._embed_all(m4a_path, meta)
+            final_path = m4a_path
+            if self._should_transcode(info):
+                mp3_path = self._convert_to_mp3(m4a_path, meta)
+                if mp3_path and mp3_path.exists():
+                    os.remove(m4a_path)
+                    final_path = mp3_path
+
+        return {
+            'success': True,
+            'filename': final_path.name,
+            'title': meta.title,
+            'artist': meta.artist,
+            'album': meta.album,
+            'duration': info.get('duration', 0)
+        }
 
     def download(self, url):
         """
@@ -257,25 +610,73 @@ class MusicDownloader:
                  - error (str, if success=False)
         """
         try:
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                m4a_path = self._get_final_path(info)
-                self._embed_all(m4a_path, info)
-
-                final_path = m4a_path
-                if self.convert_to_mp3:
-                    mp3_path = self._convert_to_mp3(m4a_path)
-                    if mp3_path and mp3_path.exists():
-                        os.remove(m4a_path)
-                        final_path = mp3_path
-
-                return {
-                    'success': True,
-                    'filename': final_path.name,
-                    'title': info.get('title', 'Unknown'),
-                    'artist': info.get('artist') or info.get('uploader', 'Unknown Artist'),
-                    'album': info.get('album', 'Unknown Album'),
-                    'duration': info.get('duration', 0)
-                }
+            m4a_path, info = self._download_one(url)
+            return self._finalize(m4a_path, info)
         except Exception as e:
-            return {'success': False, 'error': str(e)}
\ No newline at end of file
+            return {'success': False, 'error': str(e)}
+
+    def playlist_entries(self, url):
+        """
+        Expand a playlist URL into its individual track URLs.
+
+        Uses a flat extraction, so the playlist page is fetched once without
+        resolving every entry.
+
+        :param url: YouTube playlist (or single video) URL.
+        :return: List of video URLs; a non-playlist URL yields just itself.
+        """
+        opts = {'quiet': True, 'extract_flat': 'in_playlist', 'noplaylist': False}
+        with yt_dlp.YoutubeDL(opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+        if info.get('_type') == 'playlist':
+            return [e['url'] for e in info.get('entries') or [] if e.get('url')]
+        return [url]
+
+    def download_batch(self, urls):
+        """
+        Download several URLs, overlapping network downloads with MP3 conversion.
+
+        Downloads run on a small thread pool (yt-dlp releases the GIL during
+        socket I/O) and finished files are handed to a single encoder worker
+        through a queue, so track N+1 downloads while track N is still being
+        converted.
+
+        :param urls: Iterable of YouTube URLs.
+        :return: List of result dictionaries, one per URL, in input order.
+        """
+        urls = list(urls)
+        results = [None] * len(urls)
+        handoff = queue.Queue()
+
+        def encode_worker():
+            while True:
+                item = handoff.get()
+                if item is None:
+                    break
+                index, m4a_path, info = item
+                try:
+                    results[index] = self._finalize(m4a_path, info)
+                except Exception as e:
+                    results[index] = {'success': False, 'error': str(e)}
+
+        encoder = threading.Thread(target=encode_worker)
+        encoder.start()
+        try:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = {
+                    pool.submit(self._download_one, url): i
+                    for i, url in enumerate(urls)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        m4a_path, info = future.result()
+                    except Exception as e:
+                        results[index] = {'success': False, 'error': str(e)}
+                    else:
+                        handoff.put((index, m4a_path, info))
+        finally:
+            handoff.put(None)
+            encoder.join()
+
+        return results
\ No newline at end of file